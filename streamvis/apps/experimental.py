@@ -1,10 +1,19 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import h5py
+import numpy as np
+from bokeh.document import without_document_lock
 from bokeh.io import curdoc
 from bokeh.layouts import column, row
 from bokeh.models import Button, Slider, TextInput
 
 import streamvis as sv
 
+logger = logging.getLogger(__name__)
+
 doc = curdoc()
 
 sv_rt = sv.Runtime()
@@ -25,42 +34,174 @@ sv_main.plot.add_layout(sv_colormapper.color_bar, place="below")
 
 sv_hist = sv.Histogram(nplots=1, height=400, width=700)
 
+# the client is redrawn periodically only if the view has changed since the last update
+redraw_needed = False
+
+
+def request_redraw(_attr, _old, _new):
+    global redraw_needed
+    redraw_needed = True
+
+
+sv_main.plot.x_range.on_change("start", request_redraw)
+sv_main.plot.x_range.on_change("end", request_redraw)
+sv_main.plot.y_range.on_change("start", request_redraw)
+sv_main.plot.y_range.on_change("end", request_redraw)
+sv_colormapper.auto_switch.on_change("active", request_redraw)
+
 file_path = TextInput(title="File Path:", value="/")
 
 dataset_path = TextInput(title="Dataset Path:", value="/")
 
 
-def _load_image_from_dataset(file, dataset, index):
-    with h5py.File(file, "r") as f:
-        image = f[dataset][index].astype("float32")
+class DatasetReader:
+    """Read images from an hdf5 dataset keeping the file open between reads."""
+
+    def __init__(self):
+        self._file = None
+        self._file_path = None
+        self._buffers = [np.empty((0, 0), dtype=np.float32)] * 2
+        self._dataset_key = None
+
+    def _get_file(self, file_path):
+        if file_path != self._file_path:
+            self.close()
+            # a larger chunk cache lets repeated reads of the same frames skip decompression
+            self._file = h5py.File(file_path, "r", rdcc_nbytes=64 * 1024 * 1024, rdcc_nslots=521)
+            self._file_path = file_path
+
+        return self._file
+
+    def _get_spare_buffer(self, shape):
+        # the first buffer holds the last returned frame, the next one is read into the second
+        if self._buffers[1].shape != shape:
+            self._buffers[1] = np.empty(shape, dtype=np.float32)
+
+        return self._buffers[1]
+
+    def read(self, file_path, dataset_path, index):
+        """Read a frame into a buffer that is not used by the previously returned frame.
+
+        The returned frame stays intact until the next successful read has finished.
+        """
+        dataset = self._get_file(file_path)[dataset_path]
+
+        dataset_key = (file_path, dataset_path)
+        if dataset_key != self._dataset_key:
+            self._dataset_key = dataset_key
+            # with (1, H, W) chunks, reading a single frame touches exactly one chunk
+            if dataset.chunks is not None and dataset.chunks[0] != 1:
+                logger.warning(
+                    f"Dataset {dataset_path} in {file_path} is not chunked per frame "
+                    f"(chunks={dataset.chunks}), image reads can be slow"
+                )
+
+        # hdf5 converts values to float32 while reading, no intermediate arrays are allocated
+        image = self._get_spare_buffer(dataset.shape[1:])
+        dataset.read_direct(image, source_sel=np.s_[index])
+        # swap buffers only after a successful read
+        self._buffers.reverse()
         metadata = dict(shape=list(image.shape))
 
-    return image, metadata
+        return image, metadata
 
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_path = None
 
-def load_file_button_callback():
-    sv_rt.image, sv_rt.metadata = _load_image_from_dataset(
-        file_path.value, dataset_path.value, image_index_slider.value
-    )
 
-    doc.add_next_tick_callback(update_client)
+h5_reader = DatasetReader()
+# a single worker keeps reads in order and never accesses the file concurrently
+h5_executor = ThreadPoolExecutor(max_workers=1)
+
+# at most one read is in progress, a newer request replaces the one waiting for it to finish
+pending_read = None
+read_in_progress = False
+
+
+def load_image(file, dataset, index, reopen=False):
+    global pending_read
+
+    if pending_read is not None:
+        # keep a requested reopen even if the frame index has been superseded
+        reopen = reopen or pending_read[3]
+
+    pending_read = (file, dataset, index, reopen)
+
+    if not read_in_progress:
+        start_next_read()
+
+
+def start_next_read():
+    global pending_read, read_in_progress
+
+    if pending_read is None:
+        read_in_progress = False
+        return
+
+    file, dataset, index, reopen = pending_read
+    pending_read = None
+    read_in_progress = True
+
+    @without_document_lock
+    async def read_image():
+        # the document is not locked during the read, so it must not be accessed here
+        loop = asyncio.get_running_loop()
+        try:
+            if reopen:
+                await loop.run_in_executor(h5_executor, h5_reader.close)
+
+            image, metadata = await loop.run_in_executor(
+                h5_executor, h5_reader.read, file, dataset, index
+            )
+        except Exception:
+            logger.exception(f"Can't read frame {index} of {dataset} in {file}")
+            doc.add_next_tick_callback(start_next_read)
+            return
+
+        doc.add_next_tick_callback(partial(show_image, image, metadata))
+
+    doc.add_next_tick_callback(read_image)
+
+
+async def show_image(image, metadata):
+    sv_rt.image, sv_rt.metadata = image, metadata
+    # a frame has been loaded successfully, so the file and dataset paths are valid
     image_index_slider.disabled = False
 
+    await update_client()
+
+    # the frame is displayed, the next read goes into the other buffer
+    start_next_read()
+
+
+def load_file_button_callback():
+    # reopen the file, it could have been modified since the last load
+    load_image(file_path.value, dataset_path.value, image_index_slider.value, reopen=True)
+
 
 load_file_button = Button(label="Load", button_type="default")
 load_file_button.on_click(load_file_button_callback)
 
 
 def image_index_slider_callback(_attr, _old, new):
-    sv_rt.image, sv_rt.metadata = _load_image_from_dataset(file_path.value, dataset_path.value, new)
-
-    doc.add_next_tick_callback(update_client)
+    load_image(file_path.value, dataset_path.value, new)
 
 
 image_index_slider = Slider(start=0, end=99, value=0, step=1, title="Pulse Number", disabled=True)
 image_index_slider.on_change("value_throttled", image_index_slider_callback)
 
 
+def session_destroyed_callback(_session_context):
+    h5_executor.submit(h5_reader.close)
+    h5_executor.shutdown(wait=False)
+
+
+doc.on_session_destroyed(session_destroyed_callback)
+
+
 # Final layouts
 layout_controls = column(
     file_path,
@@ -78,24 +219,36 @@ doc.add_root(final_layout)
 
 
 async def update_client():
+    global redraw_needed
+
     image, metadata = sv_rt.image, sv_rt.metadata
 
     sv_colormapper.update(image)
     sv_main.update(image)
 
     # Statistics
-    im_block = image[sv_main.y_start : sv_main.y_end, sv_main.x_start : sv_main.x_end]
-    sv_hist.update([im_block])
+    # the displayed image is the visible region, downsampled to at most the plot resolution
+    sv_hist.update([sv_main.displayed_image])
 
     # Update metadata
     sv_metadata.update(metadata)
 
+    # the client is up to date, including range changes made by sv_main.update itself
+    redraw_needed = False
+
 
 async def internal_periodic_callback():
+    global redraw_needed
+
     if sv_rt.image.shape == (1, 1):
         # skip client update if the current image is dummy
         return
 
+    if not redraw_needed:
+        # neither the image nor the view has changed since the last update
+        return
+
+    redraw_needed = False
     doc.add_next_tick_callback(update_client)
 
 
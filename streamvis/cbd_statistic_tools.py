@@ -1,6 +1,8 @@
 import logging
 
+import bottleneck as bn
 import numpy as np
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
@@ -11,28 +13,43 @@ class NPFIFOArray:
         self._nan = empty_value
         self.last_value = self._nan
         self._aggregate = aggregate
+        # Circular buffer: the next value is written at `_head`
+        self._head = 0
+        self._len = max_span
+        self._count = 0
 
     def update(self, values):
-        self._x = np.roll(self._x, len(values))
-        self._x[: len(values)] = values
+        # accept scalars and lists, ndarrays of a matching dtype are not copied
+        values = np.asarray(values, dtype=self._x.dtype).reshape(-1)
+        n = len(values)
+        self._head = _fifo_push_njit(self._x, self._head, values)
+
+        self._count = min(self._count + n, self._len)
         self.last_value = self._aggregate(values)
 
     def clear(self):
         self._x[...] = self._nan
+        self._head = 0
+        self._count = 0
+
+    def _valid(self):
+        # the buffer is filled from the start and wraps around only once it is full, so the
+        # populated values always form its leading part
+        return self._x[: self._count]
 
     def __bool__(self):
-        return bool(np.any(self._x != self._nan))
+        return self._count > 0
 
     def __call__(self, *args, **kwargs):
-        return self._x[self._x != self._nan]
+        return self._valid()
 
     @property
     def min(self):
-        return np.min(self.__call__())
+        return bn.nanmin(self._valid())
 
     @property
     def max(self):
-        return np.max(self.__call__())
+        return bn.nanmax(self._valid())
 
 
 class AggregatorWithID:
@@ -44,6 +61,10 @@ class AggregatorWithID:
         self._aggregate = aggregate
         self._max_sort_n = max_sort_n
         self.last_processed_index = 0
+        # Circular buffer: the next value is written at `_head`
+        self._head = 0
+        self._len = max_span
+        self._count = 0
 
     def update(self, values, pulse_id):
         if pulse_id is None:
@@ -52,40 +73,59 @@ class AggregatorWithID:
 
         # Only store aggregated value per pulse Id
         value = self._aggregate(values)
-        self._x = np.roll(self._x, -1)
-        self._x[-1] = value
+        self._x[self._head] = value
+        self._id[self._head] = pulse_id
+        self._head = (self._head + 1) % self._len
+        self._count = min(self._count + 1, self._len)
         self.last_value = value
 
-        self._id = np.roll(self._id, -1)
-        self._id[-1] = pulse_id
-
         self.last_processed_index -= 1
 
+    def _recent(self, n):
+        """Return buffer indices of the `n` most recent values in the order of arrival."""
+        n = min(n, self._len)
+        return np.arange(self._head - n, self._head) % self._len
+
     @property
     def count(self) -> int:
-        return len(self._x[self._x != self._nan])
+        return self._count
 
     def sort_by_id(self):
-        cnt = max(self.count, self._max_sort_n)
-        indices = self._id[:cnt].argsort()
-        self._id[:cnt] = self._id[indices]
-        self._x[:cnt] = self._x[indices]
+        cnt = min(max(self.count, self._max_sort_n), self._len)
+        recent = self._recent(cnt)
+        indices = recent[self._id[recent].argsort()]
+        self._id[recent] = self._id[indices]
+        self._x[recent] = self._x[indices]
 
     def clear(self):
         self._x[...] = self._nan
         self._id[...] = 0
         self.last_processed_index = 0
+        self._head = 0
+        self._count = 0
 
     def __bool__(self):
-        return bool(np.any(self._x != self._nan))
+        return self._count > 0
 
     def __call__(self, *args, **kwargs):
         if not self or self.last_processed_index == 0:
             return [], []
-        start_id = self.last_processed_index
+        recent = self._recent(-self.last_processed_index)
         self.last_processed_index = 0
-        return self._x[start_id:], self._id[start_id:]
+        return self._x[recent], self._id[recent]
 
     @property
     def last(self):
-        return self._x[-1], self._id[-1]
+        ind = (self._head - 1) % self._len
+        return self._x[ind], self._id[ind]
+
+
+@njit
+def _fifo_push_njit(buffer, head, values):
+    size = buffer.size
+    n = values.size
+    # only the most recent `size` values fit into the buffer
+    for i in range(max(0, n - size), n):
+        buffer[(head + i) % size] = values[i]
+
+    return (head + n) % size
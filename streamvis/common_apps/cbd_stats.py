@@ -92,10 +92,10 @@ doc.add_root(layout)
 def update():
     # Line plots
     if stats.number_of_streaks and stats.streak_lengths and stats.bragg_counts:
-        # Histograms - update with full data accumulated until now
-        sv_hist_1.update([np.array([stats.number_of_streaks()])])
-        sv_hist_2.update([np.array([stats.streak_lengths()])])
-        sv_hist_3.update([np.array([stats.bragg_counts()])])
+        # Histograms - update with full data accumulated until now (2d views, no copies)
+        sv_hist_1.update([stats.number_of_streaks()[np.newaxis]])
+        sv_hist_2.update([stats.streak_lengths()[np.newaxis]])
+        sv_hist_3.update([stats.bragg_counts()[np.newaxis]])
         # Stream line - just update last value
         sv_streamgraph.update(
             [
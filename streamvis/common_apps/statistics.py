@@ -87,6 +87,7 @@ def update_statistics():
         table.columns = list(table_columns.values())
         sum_table.columns = list(table_columns.values())
 
+    stats.update_hits_ratios()
     table_source.data = stats.data
     sum_table_source.data = stats.sum_data
 
@@ -11,6 +11,9 @@ js_move_zoom = """
     source.change.emit();
 """
 
+# upper limit on the number of pixel value labels drawn over the image
+MAX_PVALUE_LABELS = 4096
+
 
 class ImageView:
     def __init__(
@@ -63,6 +66,8 @@ class ImageView:
             width=width,
             toolbar_location="left",
             tools="pan,wheel_zoom,save,reset",
+            # line and scatter overlays are drawn with WebGL, other glyphs fall back to canvas
+            output_backend="webgl",
         )
         self.plot = plot
 
@@ -206,72 +211,77 @@ class ImageView:
         Args:
             image (ndarray): A source image for image view.
             pil_image (Image, optional): A source image for image view converted to PIL Image.
+                If None, the conversion is done only when the image needs to be resized.
                 Defaults to None.
+
+        Returns:
+            Image: A source image converted to PIL Image, or None if no conversion was needed.
         """
-        if pil_image is None:
-            # this makes an extra copy, see https://github.com/python-pillow/Pillow/issues/3336
-            pil_image = PIL_Image.fromarray(image.astype(np.float32, copy=False))
-
-        if (
-            self.plot.y_range.bounds[1] != pil_image.height
-            or self.plot.x_range.bounds[1] != pil_image.width
-        ):
+        im_height, im_width = image.shape
+        if self.plot.y_range.bounds[1] != im_height or self.plot.x_range.bounds[1] != im_width:
             self.plot.x_range.start = 0
             self.plot.x_range.reset_start = 0
-            self.plot.x_range.end = pil_image.width
-            self.plot.x_range.reset_end = pil_image.width
-            self.plot.x_range.bounds = (0, pil_image.width)
+            self.plot.x_range.end = im_width
+            self.plot.x_range.reset_end = im_width
+            self.plot.x_range.bounds = (0, im_width)
 
             self.plot.y_range.start = 0
             self.plot.y_range.reset_start = 0
-            self.plot.y_range.end = pil_image.height
-            self.plot.y_range.reset_end = pil_image.height
-            self.plot.y_range.bounds = (0, pil_image.height)
-
-        if (
-            self.plot.inner_width < self.x_end - self.x_start
-            or self.plot.inner_height < self.y_end - self.y_start
-        ):
+            self.plot.y_range.end = im_height
+            self.plot.y_range.reset_end = im_height
+            self.plot.y_range.bounds = (0, im_height)
+
+        # evaluate the current view boundaries only once per update
+        x_start, x_end = self.x_start, self.x_end
+        y_start, y_end = self.y_start, self.y_end
+        inner_width, inner_height = self.plot.inner_width, self.plot.inner_height
+
+        if inner_width < x_end - x_start or inner_height < y_end - y_start:
+            if pil_image is None:
+                # this makes an extra copy, see https://github.com/python-pillow/Pillow/issues/3336
+                # so convert only when the image needs to be resized
+                pil_image = PIL_Image.fromarray(image.astype(np.float32, copy=False))
+
             resized_image = np.asarray(
                 pil_image.resize(
-                    size=(self.plot.inner_width, self.plot.inner_height),
-                    box=(self.x_start, self.y_start, self.x_end, self.y_end),
+                    size=(inner_width, inner_height),
+                    box=(x_start, y_start, x_end, y_end),
                     resample=PIL_Image.NEAREST,
                 )
             )
 
         else:
-            resized_image = image[self.y_start : self.y_end, self.x_start : self.x_end]
+            resized_image = image[y_start:y_end, x_start:x_end]
 
         self._image_source.data.update(
             image=[resized_image],
-            x=[self.x_start],
-            y=[self.y_start],
-            dw=[self.x_end - self.x_start],
-            dh=[self.y_end - self.y_start],
+            x=[x_start],
+            y=[y_start],
+            dw=[x_end - x_start],
+            dh=[y_end - y_start],
         )
 
         # Draw numbers
-        canvas_pix_ratio_x = self.plot.inner_width / (self.x_end - self.x_start)
-        canvas_pix_ratio_y = self.plot.inner_height / (self.y_end - self.y_start)
-        if canvas_pix_ratio_x > 70 and canvas_pix_ratio_y > 50:
-            textv = [
-                f"{val:.1f}"
-                for val in image[self.y_start : self.y_end, self.x_start : self.x_end].flatten()
-            ]
-            xv, yv = np.meshgrid(
-                np.arange(self.x_start, self.x_end), np.arange(self.y_start, self.y_end)
-            )
-            self._pvalue_source.data.update(x=xv.flatten() + 0.5, y=yv.flatten() + 0.5, text=textv)
-        else:
+        canvas_pix_ratio_x = inner_width / (x_end - x_start)
+        canvas_pix_ratio_y = inner_height / (y_end - y_start)
+        n_labels = (y_end - y_start) * (x_end - x_start)
+        if canvas_pix_ratio_x > 70 and canvas_pix_ratio_y > 50 and n_labels <= MAX_PVALUE_LABELS:
+            block = image[y_start:y_end, x_start:x_end]
+            textv = np.char.mod("%.1f", block.ravel())
+            xs = np.arange(x_start, x_end) + 0.5
+            ys = np.arange(y_start, y_end) + 0.5
+            xv = np.tile(xs, ys.size)
+            yv = np.repeat(ys, xs.size)
+            self._pvalue_source.data.update(x=xv, y=yv, text=textv)
+        elif len(self._pvalue_source.data["x"]):
             self._pvalue_source.data.update(x=[], y=[], text=[])
 
         # Draw projections
         if self.proj_switch.active:
             im_y_len, im_x_len = resized_image.shape
 
-            h_x = np.linspace(self.x_start + 0.5, self.x_end - 0.5, im_x_len)
-            v_x = np.linspace(self.y_start + 0.5, self.y_end - 0.5, im_y_len)
+            h_x = np.linspace(x_start + 0.5, x_end - 0.5, im_x_len)
+            v_x = np.linspace(y_start + 0.5, y_end - 0.5, im_y_len)
 
             h_y = bn.nanmean(resized_image, axis=0)
             v_y = bn.nanmean(resized_image, axis=1)
@@ -281,28 +291,29 @@ class ImageView:
 
             self._hproj_source.data.update(x=h_x, y=h_y)
             self._vproj_source.data.update(x=v_y, y=v_x)
-        else:
+        elif len(self._hproj_source.data["x"]):
             self._hproj_source.data.update(x=[], y=[])
             self._vproj_source.data.update(x=[], y=[])
 
         # Update image view coordinates label text
-        self._coord_label.text = (
-            f"Y:({self.y_start}, {self.y_end}) X:({self.x_start}, {self.x_end})"
-        )
+        self._coord_label.text = f"Y:({y_start}, {y_end}) X:({x_start}, {x_end})"
 
-        # Process all accociated zoom views
+        # Process all accociated zoom views, sharing a PIL image once any of them has created it
         for zoom_view in self.zoom_views:
-            zoom_view.update(image, pil_image)
+            pil_image = zoom_view.update(image, pil_image)
+
+        return pil_image
 
 
 def _normalize(vec, start, end):
+    # map [min, max] of vec onto [start + 5%, start + 25%] of the axis range,
+    # subtract the minimum first to keep precision for float32 input with a large pedestal
     vec -= bn.nanmin(vec)
 
     v_max = bn.nanmax(vec)
-    if v_max != 0:
-        vec /= v_max
+    scale = (end - start) * 0.2 / v_max if v_max != 0 else 0.0
 
-    vec *= (end - start) * 0.2
+    np.multiply(vec, scale, out=vec)
     vec += start + (end - start) * 0.05
 
     return vec
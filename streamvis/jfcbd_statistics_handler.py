@@ -57,21 +57,21 @@ class CBDStatisticsHandler:
             return
 
         # Update Bragg aggregator with hits and non-hits alike
-        bragg_counts: list[float] = metadata.get("bragg_counts", [0])
+        bragg_counts = np.asarray(metadata.get("bragg_counts", [0]), dtype=np.float64)
         pulse_id = metadata.get("pulse_id", None)
-        self.bragg_aggregator.update(np.array(bragg_counts), pulse_id)
+        self.bragg_aggregator.update(bragg_counts, pulse_id)
 
         if not is_hit_frame:
             logger.debug(f"Not hit frame, skipping")
             return
 
-        self.bragg_counts.update(np.array([np.sum(bragg_counts)]))
+        self.bragg_counts.update(np.sum(bragg_counts))
 
         number_of_streaks: int = metadata.get("number_of_streaks", 0)
-        self.number_of_streaks.update(np.array([number_of_streaks]))
+        self.number_of_streaks.update(number_of_streaks)
 
         streak_lengths: list[float] = metadata.get("streak_lengths", [0])
-        self.streak_lengths.update(np.array(streak_lengths))
+        self.streak_lengths.update(streak_lengths)
 
     def reset(self):
         self.number_of_streaks.clear()
@@ -427,24 +427,27 @@ class StatisticsHandler:
                 if is_hit_frame:
                     self._increment(f"{switch}_hits", bin_ind)
 
-                self.data[f"{switch}_hits_ratio"][bin_ind] = (
-                    self.data[f"{switch}_hits"][bin_ind] / self.data[f"{switch}_nframes"][bin_ind]
-                )
-                self.sum_data[f"{switch}_hits_ratio"][-1] = (
-                    self.sum_data[f"{switch}_hits"][-1] / self.sum_data[f"{switch}_nframes"][-1]
-                )
+                # hits ratios are computed on demand in update_hits_ratios()
             else:
                 self.data["laser_on_nframes"][bin_ind] = np.nan
                 self.data["laser_on_hits"][bin_ind] = np.nan
-                self.data["laser_on_hits_ratio"][bin_ind] = np.nan
                 self.data["laser_off_nframes"][bin_ind] = np.nan
                 self.data["laser_off_hits"][bin_ind] = np.nan
-                self.data["laser_off_hits_ratio"][bin_ind] = np.nan
 
     def _increment(self, key, ind):
         self.data[key][ind] += 1
         self.sum_data[key][-1] += 1
 
+    def update_hits_ratios(self):
+        """Recalculate laser on/off hits ratios from the accumulated hits and nframes counters."""
+        with self._lock:
+            for data in (self.data, self.sum_data):
+                for switch in ("laser_on", "laser_off"):
+                    hits = np.array(data[f"{switch}_hits"], dtype=float)
+                    nframes = np.array(data[f"{switch}_nframes"], dtype=float)
+                    ratio = np.divide(hits, nframes, out=np.zeros_like(hits), where=nframes != 0)
+                    data[f"{switch}_hits_ratio"][:] = ratio.tolist()
+
     def reset(self):
         """Reset statistics entries."""
         with self._lock:
@@ -41,6 +41,11 @@ class ResolutionRings:
         self._sv_metadata = sv_metadata
         self._sv_streamctrl = sv_streamctrl
         self.positions = np.array(positions)
+        self._ring_text = [str(s) + " Å" for s in self.positions]
+
+        # ring diameters depend only on detector distance and beam energy, cache the last result
+        self._ring_diams_key = None
+        self._ring_diams = None
 
         # ---- add resolution tooltip to hover tool
         self._formatter_source = ColumnDataSource(
@@ -150,17 +155,23 @@ class ResolutionRings:
             self._clear()
             return
 
-        array_beam_center_x = beam_center_x * np.ones(len(self.positions))
-        array_beam_center_y = beam_center_y * np.ones(len(self.positions))
-        # if '6200 / beam_energy > 1', then arcsin returns nan
-        theta = np.arcsin(6200 / beam_energy / self.positions)  # 6200 = 1.24 / 2 / 1e-4
-        ring_diams = 2 * detector_distance * np.tan(2 * theta) / 75e-6
-        # if '2 * theta > pi / 2 <==> diams < 0', then return nan
-        ring_diams[ring_diams < 0] = np.nan
+        ring_diams_key = (detector_distance, beam_energy)
+        if ring_diams_key != self._ring_diams_key:
+            # if '6200 / beam_energy > 1', then arcsin returns nan
+            theta = np.arcsin(6200 / beam_energy / self.positions)  # 6200 = 1.24 / 2 / 1e-4
+            ring_diams = 2 * detector_distance * np.tan(2 * theta) / 75e-6
+            # if '2 * theta > pi / 2 <==> diams < 0', then return nan
+            ring_diams[ring_diams < 0] = np.nan
+
+            self._ring_diams_key = ring_diams_key
+            self._ring_diams = ring_diams
+
+        ring_diams = self._ring_diams
+        array_beam_center_x = np.broadcast_to(beam_center_x, self.positions.shape)
+        array_beam_center_y = np.broadcast_to(beam_center_y, self.positions.shape)
 
         text_x = array_beam_center_x + ring_diams / 2
         text_y = array_beam_center_y
-        ring_text = [str(s) + " Å" for s in self.positions]
 
         self._source.data.update(
             x=array_beam_center_x,
@@ -169,5 +180,5 @@ class ResolutionRings:
             h=ring_diams,
             text_x=text_x,
             text_y=text_y,
-            text=ring_text,
+            text=self._ring_text,
         )
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from streamvis.cbd_statistic_tools import AggregatorWithID, NPFIFOArray
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 7])
+def test_fifo_keeps_most_recent_values(chunk):
+    fifo = NPFIFOArray(dtype=float, empty_value=np.nan, max_span=10)
+    values = np.arange(25, dtype=float)
+    for i in range(0, len(values), chunk):
+        fifo.update(values[i : i + chunk])
+
+    np.testing.assert_array_equal(np.sort(fifo()), values[-10:])
+    assert fifo.min == 15
+    assert fifo.max == 24
+
+
+def test_fifo_update_larger_than_span():
+    fifo = NPFIFOArray(dtype=float, empty_value=np.nan, max_span=5)
+    fifo.update(np.arange(12, dtype=float))
+
+    np.testing.assert_array_equal(np.sort(fifo()), np.arange(7, 12))
+
+
+def test_fifo_clear():
+    fifo = NPFIFOArray(dtype=int, empty_value=-1, max_span=5)
+    fifo.update(np.array([1, 2, 3]))
+    fifo.clear()
+
+    assert not fifo
+    assert len(fifo()) == 0
+
+
+def test_aggregator_returns_unprocessed_values_in_order():
+    aggregator = AggregatorWithID(dtype=float, empty_value=np.nan, max_span=4)
+    for pulse_id in range(6):
+        aggregator.update([pulse_id, 1], pulse_id)
+
+    values, pulse_ids = aggregator()
+    np.testing.assert_array_equal(pulse_ids, [2, 3, 4, 5])
+    np.testing.assert_array_equal(values, [3, 4, 5, 6])
+    assert aggregator.last == (6, 5)
+
+    # all values have already been retrieved
+    assert aggregator() == ([], [])
+
+    aggregator.update([10], 6)
+    values, pulse_ids = aggregator()
+    np.testing.assert_array_equal(pulse_ids, [6])
+
+
+def test_aggregator_sort_by_id():
+    aggregator = AggregatorWithID(dtype=float, empty_value=np.nan, max_span=4, max_sort_n=4)
+    for pulse_id in (3, 1, 4, 2, 0):
+        aggregator.update([pulse_id * 10], pulse_id)
+
+    aggregator.sort_by_id()
+    assert aggregator.last == (40, 4)
+
+
+def test_aggregator_count():
+    aggregator = AggregatorWithID(dtype=float, empty_value=np.nan, max_span=4)
+    assert not aggregator
+    assert aggregator.count == 0
+
+    for pulse_id in range(3):
+        aggregator.update([1], pulse_id)
+    assert aggregator.count == 3
+
+    for pulse_id in range(3, 10):
+        aggregator.update([1], pulse_id)
+    assert aggregator.count == 4
+
+    aggregator.clear()
+    assert aggregator.count == 0
+
+
+def test_fifo_update_with_scalars_and_lists():
+    fifo = NPFIFOArray(dtype=int, empty_value=-1, max_span=10)
+    fifo.update(3)
+    fifo.update([1, 2])
+
+    np.testing.assert_array_equal(np.sort(fifo()), [1, 2, 3])
+    assert fifo.last_value == 1.5
@@ -4,6 +4,7 @@ import pytest
 from PIL import Image as PIL_Image
 
 import streamvis as sv
+from streamvis.image_view import _normalize
 
 test_image = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32)
 test_pil_image = PIL_Image.fromarray(test_image)
@@ -29,3 +30,48 @@ def test_glyph_class(im_plot_with_cm):
 #     image_out = im_plot_with_cm.update(test_image, test_pil_image)
 
 #     assert image_out.shape == (800, 800)
+
+
+def _normalize_reference(vec, start, end):
+    # four-pass implementation the fused version has to match
+    vec -= np.nanmin(vec)
+
+    v_max = np.nanmax(vec)
+    if v_max != 0:
+        vec /= v_max
+
+    vec *= (end - start) * 0.2
+    vec += start + (end - start) * 0.05
+
+    return vec
+
+
+@pytest.mark.parametrize(
+    "vec",
+    [
+        np.array([0, 1, 2, 3, 4, 5], dtype=np.float32),
+        np.array([-3, 7, np.nan, 2], dtype=np.float32),
+        1e4 + np.linspace(0, 0.01, 6, dtype=np.float32),
+        np.random.default_rng(0).random(100) * 1e3,
+    ],
+)
+def test_normalize(vec):
+    result = _normalize(vec.copy(), 0, 1000)
+    expected = _normalize_reference(vec.copy(), 0, 1000)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-5)
+    assert np.nanmin(result) == pytest.approx(50)
+    assert np.nanmax(result) == pytest.approx(250, rel=1e-5)
+
+
+def test_normalize_constant():
+    result = _normalize(np.full(5, 3.0, dtype=np.float32), 100, 200)
+
+    np.testing.assert_allclose(result, _normalize_reference(np.full(5, 3.0), 100, 200))
+    np.testing.assert_allclose(result, 105)
+
+
+def test_normalize_all_nan():
+    result = _normalize(np.full(5, np.nan, dtype=np.float32), 0, 10)
+
+    assert np.all(np.isnan(result))
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(name="stats", params=["streamvis.jf_adapter", "streamvis.jfjoch_adapter"])
+def _stats(request):
+    module = pytest.importorskip(request.param)
+    stats = module.StatisticsHandler()
+
+    # counters as accumulated by 'parse' for three pulse_id bins:
+    # laser on/off frames, no laser off frames, no laser information
+    stats.data.update(
+        pulse_id_bins=[0, 10000, 20000],
+        nframes=[6, 2, 3],
+        bad_frames=[0, 0, 0],
+        sat_pix_nframes=[0, 0, 0],
+        laser_on_nframes=[4, 2, np.nan],
+        laser_on_hits=[1, 2, np.nan],
+        laser_on_hits_ratio=[0, 0, 0],
+        laser_off_nframes=[2, 0, np.nan],
+        laser_off_hits=[1, 0, np.nan],
+        laser_off_hits_ratio=[0, 0, 0],
+    )
+    stats.sum_data.update(
+        laser_on_nframes=[6],
+        laser_on_hits=[3],
+        laser_on_hits_ratio=[0],
+        laser_off_nframes=[2],
+        laser_off_hits=[1],
+        laser_off_hits_ratio=[0],
+    )
+
+    yield stats
+
+
+def test_hits_ratios(stats):
+    stats.update_hits_ratios()
+
+    assert stats.data["laser_on_hits_ratio"][:2] == [0.25, 1]
+    assert stats.data["laser_off_hits_ratio"][:2] == [0.5, 0]
+
+
+def test_hits_ratios_without_laser_info(stats):
+    stats.update_hits_ratios()
+
+    assert np.isnan(stats.data["laser_on_hits_ratio"][2])
+    assert np.isnan(stats.data["laser_off_hits_ratio"][2])
+
+
+def test_hits_ratios_summary(stats):
+    stats.update_hits_ratios()
+
+    assert stats.sum_data["laser_on_hits_ratio"] == [0.5]
+    assert stats.sum_data["laser_off_hits_ratio"] == [0.5]
+
+
+def test_hits_ratios_empty_summary(stats):
+    stats.reset()
+    stats.update_hits_ratios()
+
+    assert stats.data["laser_on_hits_ratio"] == []
+    assert stats.sum_data["laser_on_hits_ratio"] == [0]